@@ -1,7 +1,26 @@
-from fastapi import FastAPI, Query, HTTPException
-from app.validators import *
-from fastapi import FastAPI, Query, File, UploadFile
-from pydantic import BaseModel
+from typing import Union
+from fastapi import FastAPI, Query, HTTPException, UploadFile, Body
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from app.validators import (
+    DocumentValidator,
+    ImageValidator,
+    DateValidator,
+    BooleanValidator,
+    PasswordValidator,
+    CrossFieldDateValidator,
+    numeric_validator,
+    alphanumeric_validator,
+    alphabetset_validator,
+    email_validator,
+    zipcode_validator,
+    pincode_validator,
+    get_range_validator,
+    get_age_validator,
+    get_decimal_validator,
+    get_length_validator,
+    get_phone_number_validator,
+)
 
 
 app = FastAPI(title="General Validations",
@@ -9,6 +28,49 @@ app = FastAPI(title="General Validations",
              version="1.0.0")
 
 
+# The upload endpoints enforce their own size limits rather than the validators' defaults.
+document_validator = DocumentValidator(max_file_size_mb=2)  # Allow documents up to 2 MB
+image_validator = ImageValidator(max_file_size_mb=1)  # Allow images up to 1 MB
+
+
+# Multipart boundaries and part headers add some bytes on top of the file itself.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects uploads whose Content-Length is already over the endpoint's limit with 413,
+    before any of the body is received or spooled to disk.
+    """
+    def __init__(self, app, limits_mb: dict):
+        self.app = app
+        self.limits_mb = limits_mb
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            limit_mb = self.limits_mb.get(scope["path"])
+            if limit_mb is not None:
+                content_length = dict(scope["headers"]).get(b"content-length")
+                limit = limit_mb * 1024 * 1024 + MULTIPART_OVERHEAD_BYTES
+                if content_length and content_length.isdigit() and int(content_length) > limit:
+                    response = JSONResponse(
+                        status_code=413,
+                        content={"detail": {"error": f"File size exceeds {limit_mb} MB limit."}},
+                    )
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits_mb={
+        "/validate-document": document_validator.max_file_size_mb,
+        "/validate-image": image_validator.max_file_size_mb,
+    },
+)
+
+
 @app.get("/")
 async def root():
     return {
@@ -27,14 +89,7 @@ async def validate_numeric_field(
     """
     Validates if the input is numeric.
     """
-    # Initialize the numeric validator
-    numeric_validator = NumericValidator()
-
-    try:
-        # Validate the value
-        validated_value = numeric_validator.validate(value)
-    except HTTPException as e:
-        raise e
+    validated_value = numeric_validator.validate(value)
 
     return {"message": "Value is a valid numeric value.", "validated_value": validated_value}
 
@@ -48,14 +103,9 @@ async def validate_range_field(
     """
     Validates if the numeric value is within a specified range.
     """
-    # Initialize the range validator
-    range_validator = RangeValidator(min_value=min_value, max_value=max_value)
+    range_validator = get_range_validator(min_value, max_value)
 
-    try:
-        # Validate the value
-        validated_value = range_validator.validate(value)
-    except HTTPException as e:
-        raise e
+    validated_value = range_validator.validate(value)
 
     return {
         "message": "Value is within the specified range.",
@@ -73,14 +123,12 @@ async def validate_age_field(
     """
     Validate the age input by calling the AgeValidator.
     """
-    # Initialize the age validator with an optional maximum age
-    age_validator = AgeValidator(max_age=max_age)
+    # Get the age validator for the optional maximum age
+    age_validator = get_age_validator(max_age)
 
     try:
         # Validate the age
         validated_age = age_validator.validate(age)
-    except HTTPException as e:
-        raise e  # If validation fails, it will raise HTTPException
     except ValueError:
         # Catch if non-numeric value is entered
         raise HTTPException(status_code=400, detail="Age must be a valid numeric value.")
@@ -92,14 +140,10 @@ async def validate_decimal_field(
     value: str = Query(..., title="Value", description="Enter the value to check if it's a decimal."),
     max_decimal_places: int = Query(None, title="Max Decimal Places", description="Specify the maximum decimal places if needed.")
 ):
-    # Initialize the decimal validator with optional max decimal places
-    decimal_validator = DecimalValidator(max_decimal_places=max_decimal_places)
+    # Get the decimal validator for the optional max decimal places
+    decimal_validator = get_decimal_validator(max_decimal_places)
     
-    try:
-        # Validate the value
-        decimal_validator.validate(value)
-    except HTTPException as e:
-        raise e
+    decimal_validator.validate(value)
     
     return {"message": "Value is a valid decimal number."}
 
@@ -110,14 +154,10 @@ async def validate_length_field(
     min_length: int = Query(3, ge=1, title="Minimum Length", description="Specify the minimum length."),
     max_length: int = Query(10, le=100, title="Maximum Length", description="Specify the maximum length.")
 ):
-    # Initialize the length validator with dynamic min and max length from query parameters
-    min_max_length_validator = MinMaxLengthValidator(min_length=min_length, max_length=max_length)
+    # Get the length validator for the min and max length from query parameters
+    min_max_length_validator = get_length_validator(min_length, max_length)
     
-    try:
-        # Validate the value
-        min_max_length_validator.validate(value)
-    except HTTPException as e:
-        raise e
+    min_max_length_validator.validate(value)
     
     return {"message": "Value is within the valid length range."}
 
@@ -125,14 +165,7 @@ async def validate_length_field(
 async def validate_alphanumeric_field(
     value: str = Query(..., title="Value", description="Enter the value to check if it's alphanumeric.")
 ):
-    # Initialize the alphanumeric validator
-    alphanumeric_validator = AlphanumericValidator()
-    
-    try:
-        # Validate the value
-        alphanumeric_validator.validate(value)
-    except HTTPException as e:
-        raise e
+    alphanumeric_validator.validate(value)
     
     return {"message": "Value is a valid alphanumeric string."}
 
@@ -140,14 +173,7 @@ async def validate_alphanumeric_field(
 async def validate_alphabetset_field(
     value: str = Query(..., title="Value", description="Enter the value to check if it's character string.")
 ):
-    # Initialize the alphanumeric validator
-    alphabetset_validator = AlphabetSetValidator()
-    
-    try:
-        # Validate the value
-        alphabetset_validator.validate(value)
-    except HTTPException as e:
-        raise e
+    alphabetset_validator.validate(value)
     
     return {"message": "Value is a valid character string."}
 
@@ -158,7 +184,7 @@ async def validate_phone_number(phonenumber: str, region: str = None):
     :param phonenumber: The phone number to validate.
     :param region: Optional region for additional validation (not used in this global implementation).
     """
-    phone_number_validator = PhoneNumberValidator(region=region)
+    phone_number_validator = get_phone_number_validator(region)
 
     try:
         validation_result = phone_number_validator.validate(phonenumber)
@@ -178,14 +204,8 @@ async def validate_email(
     Validate email ID by calling the EmailValidator.
     :param emailid: The email ID to validate.
     """
-    # Create an instance of the EmailValidator
-    email_validator = EmailValidator()  # Adjust lengths as per your needs
-
-    # Validate email ID
-    try:
-        email_validator.validate(emailid)
-    except HTTPException as e:
-        raise e  # If validation fails, it will raise HTTPException
+    # Validate email ID; an uncached MX lookup runs in the threadpool, off the event loop
+    await email_validator.validate_async(emailid)
 
     return {"message": "Validation successful!"}
 
@@ -197,9 +217,6 @@ async def validate_zipcode(
     Validate zip code by calling the ZipcodeValidator.
     :param zipcode: The zip code to validate.
     """
-    # Create an instance of the ZipcodeValidator
-    zipcode_validator = ZipcodeValidator()  # Adjust lengths as per your needs
-
     # Validate zip code
     try:
         zipcode_validator.validate(zipcode)
@@ -217,9 +234,6 @@ async def validate_pincode(
     Validate pincode by calling the PincodeValidator.
     :param pincode: The pincode to validate.
     """
-    # Create an instance of the PincodeValidator
-    pincode_validator = PincodeValidator()  # Adjust lengths as per your needs
-
     # Validate pincode
     try:
         pincode_validator.validate(pincode)
@@ -233,8 +247,12 @@ async def validate_document_file(file: UploadFile):
     """
     Endpoint to validate Document files.
     """
-    document_validator = DocumentValidator(max_file_size_mb=2)  # Allow PDFs up to 2 MB
-    document_validator.validate(file)
+    try:
+        # Reading the spooled file blocks, so keep it off the event loop
+        await run_in_threadpool(document_validator.validate, file)
+    finally:
+        # Release the spooled temporary file as soon as validation is done
+        await file.close()
     return {"message": "Document file is valid."}
 
 
@@ -243,114 +261,26 @@ async def validate_image_file(file: UploadFile):
     """
     Endpoint to validate image files.
     """
-    image_validator = ImageValidator(max_file_size_mb=1)  # Allow images up to 1 MB
-    image_validator.validate(file)
+    try:
+        # Reading the spooled file blocks, so keep it off the event loop
+        await run_in_threadpool(image_validator.validate, file)
+    finally:
+        # Release the spooled temporary file as soon as validation is done
+        await file.close()
     return {"message": "Image file is valid."}
-class DateInput(BaseModel):
-    date: str
 
 @app.post("/validate-date/")
-async def validate_date_endpoint(data: DateInput):
+async def validate_date_endpoint(date: str = Body(..., embed=True)):
     """
     Endpoint to validate a date input.
     """
     # Initialize the DateValidator
-    validator = DateValidator(data.date)
+    validator = DateValidator(date)
 
     # Perform all validations
     validator.validate()
 
-    return {"message": "Date is valid!", "date": data.date}
-
-class DOBInput(BaseModel):
-    date_of_birth: str
-
-
-
-
-@app.post("/validate-numeric") 
-async def validate_numeric_field( 
-    value: str = Query(..., title="Value", description="Enter the value to check if it's numeric."), 
-    min_value: float = Query(None, title="Min Value", description="Minimum allowed value for the number."), 
-    max_value: float = Query(None, title="Max Value", description="Maximum allowed value for the number."), 
-): 
-    # Initialize the numeric validator with optional min and max values 
-    numeric_validator = NumericValidator(min_value=min_value, max_value=max_value) 
-     
-    try: 
-        # Validate the value 
-        numeric_validator.validate(value) 
-    except HTTPException as e: 
-        raise e 
-     
-    return {"message": "Value is a valid numeric integer."} 
- 
- 
-@app.post("/validate-decimal") 
-async def validate_decimal_field( 
-    value: str = Query(..., title="Value", description="Enter the value to check if it's a decimal."), 
-    max_decimal_places: int = Query(None, title="Max Decimal Places", description="Specify the maximum decimal places if needed.") 
-): 
-    # Initialize the decimal validator with optional max decimal places 
-    decimal_validator = DecimalValidator(max_decimal_places=max_decimal_places) 
-     
-    try: 
-        # Validate the value 
-        decimal_validator.validate(value) 
-    except HTTPException as e: 
-        raise e 
-     
-    return {"message": "Value is a valid decimal number."} 
- 
- 
-@app.post("/validate-length") 
-async def validate_length_field( 
-    value: str = Query(..., title="Value", description="Enter the value to check its length."), 
-    min_length: int = Query(3, ge=1, title="Minimum Length", description="Specify the minimum length."), 
-    max_length: int = Query(10, le=100, title="Maximum Length", description="Specify the maximum length.") 
-): 
-    # Initialize the length validator with dynamic min and max length from query parameters 
-    min_max_length_validator = MinMaxLengthValidator(min_length=min_length, max_length=max_length) 
-     
-    try: 
-        # Validate the value 
-        min_max_length_validator.validate(value) 
-    except HTTPException as e: 
-        raise e 
-     
-    return {"message": "Value is within the valid length range."} 
- 
-@app.post("/validate-alphanumeric") 
-async def validate_alphanumeric_field( 
-    value: str = Query(..., title="Value", description="Enter the value to check if it's alphanumeric.") 
-): 
-    # Initialize the alphanumeric validator 
-    alphanumeric_validator = AlphanumericValidator() 
-     
-    try: 
-        # Validate the value 
-        alphanumeric_validator.validate(value) 
-    except HTTPException as e: 
-        raise e 
-     
-    return {"message": "Value is a valid alphanumeric string."} 
- 
-
- 
- 
-# @app.post("/validate-phone-number") 
-# async def validate_phone_number_endpoint( 
-#     phonenumber: str 
-# ): 
-#     phone_number_validator = PhoneNumberValidator() 
-     
-#     try: 
-#         phone_number_validator.validate(phonenumber) 
-#     except HTTPException as e: 
-#         raise e 
- 
-#     return {"message": "Phone number is valid."}
-
+    return {"message": "Date is valid!", "date": date}
 
 # Boolean validation
 
@@ -378,10 +308,6 @@ async def validate_password_endpoint(password: str):
     return {"message": "Password is valid!"}
 
 # cross_Field validation
-class DateRangeInput(BaseModel):
-    start_date: str
-    end_date: str
-
 @app.post("/validate-date-range/")
 async def validate_date_range(start_date: str, end_date: str):
     """
@@ -397,101 +323,9 @@ async def validate_date_range(start_date: str, end_date: str):
     }
 
 
-# @app.post("/validate_pincode")
-# async def validate_pincode_endpoint(pincode: str, address: str):
-#     """
-#     API endpoint to validate a pincode.
-#     """
-#     # Use the imported validation function
-#     validate_pincode(pincode)
-#     validate_address(address)
-#     return {"message": "Pincode is valid!", "pincode": pincode, "address": address}
-
-
-# @app.post("/validate_address")
-# async def validate_address_endpoint(address: str):
-#     """
-#     API endpoint to validate the address field.
-#     """
-#     # Validate and normalize the address
-#     validated_address = validate_address(address)
-
-#     return {"message": "Address is valid!", "address": validated_address}
-
-
-# @app.post("/validate_gender")
-# async def validate_gender_endpoint(gender: str):
-#     """
-#     API endpoint to validate the gender field.
-#     """
-#     # Validate and normalize the gender
-#     validated_gender = validate_gender(gender)
-
-#     return {"message": "Gender is valid!", "gender": validated_gender}
-
-
-# @app.post("/validate_names")
-# async def validate_names(firstname: str, lastname: str, middlename: str = None):
-#     """
-#     API endpoint to validate firstname, lastname, and middlename.
-#     """
-#     # Validate each name
-#     validate_name(firstname, "firstname")
-#     validate_name(lastname, "lastname")
-#     if middlename:  # Middlename is optional
-#         validate_name(middlename, "middlename")
-
-#     return {
-#         "message": "All name fields are valid!",
-#         "firstname": firstname,
-#         "lastname": lastname,
-#         "middlename": middlename
-#     }
-
-# @app.post("/validate_password")
-# async def validate_password_endpoint(password: str):
-#     """
-#     API endpoint to validate the password field.
-#     """
-#     # Validate the password
-#     validated_password = validate_password(password)
-
-#     return {"message": "Password is valid!", "password": validated_password}
-# # Route to validate inputs
-# @app.get("/validate-placename")
-# async def validate_place(
-#     placename: str = Query(..., title="Place Name", description="Enter the place name to validate."),
-# ):
-#     # Validate place name
-#     validate_placename(placename)
-        
-#     return {"message": "Validation successful!"}
-
-# @app.get("/validate-emailid")
-# async def validate_email(
-#     emailid: str = Query(..., title="Email ID", description="Enter the email ID to validate.")
-# ):
-    
-#     # Validate email ID
-#     validate_emailid(emailid)
-    
-#     return {"message": "Validation successful!"}
+if __name__ == "__main__":
+    import os
+    import uvicorn
 
-
-# @app.get("/validate-phonenumber")
-# async def validate_phone(
-#     phonenumber: str = Query(..., title="Phone Number", description="Enter the phone number to validate.")
-# ):
-    
-#     # Validate email ID
-#     validate_phonenumber(phonenumber)
-    
-#     return {"message": "Validation successful!"}
-
-# @app.post("/upload-image/")
-# async def upload_image(file: UploadFile = File(...)):
-#     """
-#     Endpoint to handle image uploads.
-#     """
-#     validate_image(file)
-#     return {"filename": file.filename, "message": "Image is valid and uploaded successfully!"}
+    # "auto" picks uvloop and httptools when they are installed (uvicorn[standard]).
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, loop="auto", http="auto", workers=os.cpu_count())
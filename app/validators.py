@@ -1,15 +1,33 @@
 import re, os
-import dns.resolver
-import html
-# import phonenumbers
-# from phonenumbers import parse, is_valid_number, is_possible_number, NumberParseException, PhoneNumberType
-from fastapi import HTTPException,  UploadFile
+import logging
+import threading
+import time
+from functools import lru_cache
+from datetime import datetime
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from typing import Union, List
 
+logger = logging.getLogger(__name__)
+
+
+# Patterns are compiled once at import and their match methods bound, so validate() never
+# goes through re's cache or a per-call attribute lookup.
+_phone_number_fullmatch = re.compile(r"\+?[1-9]\d{0,2}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}").fullmatch
+# Longest input _phone_number_fullmatch can match: 20 digits plus six optional separators.
+_PHONE_NUMBER_MAX_CHARS = 26
+_non_digit_sub = re.compile(r"[^\d]").sub
+_email_fullmatch = re.compile(r"[a-z0-9_.+-]+@[a-z0-9-]+\.[a-z0-9-.]+").fullmatch
+
+# Uploads are read in chunks of this size so the whole body never sits in memory at once.
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class BaseValidator:
     """Base class for all validators to ensure a unified interface."""
 
+    __slots__ = ()
+
     def validate(self, value):
         """This method should be implemented in child classes."""
         raise NotImplementedError("Subclasses should implement this method.")
@@ -25,30 +43,34 @@ class BaseValidator:
 class NumericValidator(BaseValidator):
     """Validates if the value is numeric (integer or float)."""
 
+    __slots__ = ()
+
     def validate(self, value: Union[str, int, float]):
+        self._to_float(value)
+        return True
+
+    def _to_float(self, value: Union[str, int, float]) -> float:
+        """Converts the value to a float, raising a validation error if it is not numeric."""
         try:
-            # Try converting the value to a float to check if it's numeric
-            float(value)
+            return float(value)
         except ValueError:
             self.raise_validation_error(
                 f"Input '{value}' is not a valid number. Please provide a valid numeric value."
             )
-        return True
 
 
 class RangeValidator(NumericValidator):
     """Validates if the numeric value is within a specified range."""
 
+    __slots__ = ("min_value", "max_value")
+
     def __init__(self, min_value: Union[int, float] = None, max_value: Union[int, float] = None):
         self.min_value = min_value
         self.max_value = max_value
 
     def validate(self, value: Union[str, int, float]):
-        # First, ensure the value is numeric
-        super().validate(value)
-
-        # Convert the value to a float for range comparison
-        float_value = float(value)
+        # Ensure the value is numeric and convert it once for the range comparison
+        float_value = self._to_float(value)
 
         # Validate range constraints
         if self.min_value is not None and float_value < self.min_value:
@@ -62,31 +84,32 @@ class RangeValidator(NumericValidator):
 class AgeValidator(RangeValidator):
     """Validates that the value is a valid age (18 or older by default)."""
 
-    def __init__(self, min_age: int = 18):
-        # Initialize RangeValidator with a fixed minimum age
-        super().__init__(min_value=min_age)
+    __slots__ = ()
 
-    def validate(self, value: Union[str, int, float]):
-        # Perform the range validation for age
-        super().validate(value)
-        return True
+    def __init__(self, min_age: int = 18, max_age: int = None):
+        # Initialize RangeValidator with a fixed minimum age and an optional maximum age
+        super().__init__(min_value=min_age, max_value=max_age)
 
 
 class DecimalValidator(BaseValidator):
     """Validates if the value is a decimal number with optional precision."""
 
+    __slots__ = ("max_decimal_places", "_max_places")
+
     def __init__(self, max_decimal_places: int = None):
         self.max_decimal_places = max_decimal_places
+        # Up to 10 decimal places are allowed when no limit is given
+        self._max_places = max_decimal_places if max_decimal_places else 10
 
     def validate(self, value):
         
-        # Sanitize the input
-        value = html.escape(str(value))
+        value = str(value)
         
-        # Update regex pattern to allow negative numbers, integers, and decimals
-        regex = r"^-?\d+(\.\d{1," + (str(self.max_decimal_places) if self.max_decimal_places else "10") + "})?$"
-        
-        if not re.match(regex, value):
+        # Allows negative numbers, integers, and decimals: -?digits(.digits)?
+        integer_part, dot, fraction = (value[1:] if value.startswith("-") else value).partition(".")
+        if not integer_part.isdecimal() or (
+            dot and not (len(fraction) <= self._max_places and fraction.isdecimal())
+        ):
             self.raise_validation_error("Value must be a valid decimal number.")
         
         return True
@@ -95,20 +118,20 @@ class DecimalValidator(BaseValidator):
 class MinMaxLengthValidator(BaseValidator):
     """Validates the minimum and maximum length of a string."""
 
+    __slots__ = ("min_length", "max_length")
+
     def __init__(self, min_length: int = None, max_length: int = None):
         self.min_length = min_length
         self.max_length = max_length
 
     def validate(self, value):
-        # Sanitize the input
-        value = html.escape(str(value))
-        if not isinstance(value, str):
-            self.raise_validation_error("Value must be a string.")
+        value = str(value)
 
-        if self.min_length and len(value) < self.min_length:
+        length = len(value)
+        if self.min_length is not None and length < self.min_length:
             self.raise_validation_error(f"String must be at least {self.min_length} characters long.")
         
-        if self.max_length and len(value) > self.max_length:
+        if self.max_length is not None and length > self.max_length:
             self.raise_validation_error(f"String must be at most {self.max_length} characters long.")
         
         return True
@@ -116,33 +139,37 @@ class MinMaxLengthValidator(BaseValidator):
 
 class AlphanumericValidator(BaseValidator):
     """Validates if the value is alphanumeric (letters and numbers only)."""
+
+    __slots__ = ()
     
     def validate(self, value):
         if not value:
             self.raise_validation_error("Textfield cannot be empty.")
-        # Sanitize the input
-        value = html.escape(str(value))
-        # Regex to match only alphanumeric characters (letters and digits)
-        if not re.match(r"^[a-zA-Z0-9]+$", str(value)):
+        value = str(value)
+        # Only ASCII letters and digits are allowed; both checks run in C without the regex engine
+        if not (value.isascii() and value.isalnum()):
             self.raise_validation_error("Value must be alphanumeric (letters and numbers only).")
         return True
     
 class AlphabetSetValidator(BaseValidator):
     """Validates if the value is alphabets (letters only)."""
+
+    __slots__ = ()
     
     def validate(self, value):
         if not value:
             self.raise_validation_error("Textfield cannot be empty.")
-        # Sanitize the input
-        value = html.escape(str(value))
-        # Regex to match only alphanumeric characters (letters and digits)
-        if not re.match(r"^[a-zA-Z]+$", str(value)):
+        value = str(value)
+        # Only ASCII letters are accepted
+        if not (value.isascii() and value.isalpha()):
             self.raise_validation_error("Value must be alphabets (letters only).")
         return True
 
 class PhoneNumberValidator(MinMaxLengthValidator):
     """Validates global phone numbers using regex."""
 
+    __slots__ = ("region",)
+
     def __init__(self, min_length: int = 8, max_length: int = 14, region: str = None):
         """
         Initialize the validator with optional min_length, max_length, and region.
@@ -160,27 +187,120 @@ class PhoneNumberValidator(MinMaxLengthValidator):
         """
         if not phonenumber:
             self.raise_validation_error("Phone number cannot be empty.")
-            
-        # Sanitize the input to prevent XSS
-        phonenumber = html.escape(phonenumber)
-
-        # Regex for global phone numbers with optional separators and country code
-        regex = r"^\+?[1-9]\d{0,2}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}$"
 
-        # Match the phone number against the regex
-        if not re.fullmatch(regex, phonenumber):
+        # Anything longer than the pattern can match is rejected before it reaches the regex engine
+        if len(phonenumber) > _PHONE_NUMBER_MAX_CHARS:
+            self.raise_validation_error("Invalid phone number format.")
+            
+        # Match the phone number against the global format (optional separators and country code)
+        if not _phone_number_fullmatch(phonenumber):
             self.raise_validation_error("Invalid phone number format.")
 
         # Remove non-digit characters
-        digits_only = re.sub(r"[^\d]", "", phonenumber)
+        digits_only = _non_digit_sub("", phonenumber)
         
-        # Validate the length using the min_length and max_length passed to the parent class
-        super().validate(digits_only)
+        # Validate the digit count against min_length and max_length, with the parent class's messages
+        digit_count = len(digits_only)
+        if self.min_length is not None and digit_count < self.min_length:
+            self.raise_validation_error(f"String must be at least {self.min_length} characters long.")
+        if self.max_length is not None and digit_count > self.max_length:
+            self.raise_validation_error(f"String must be at most {self.max_length} characters long.")
 
         return "Valid phone number."
     
+# MX answers are cached per domain: found records for their TTL (capped at an hour), missing
+# ones for five minutes so repeated typos do not go back to the resolver on every request.
+_MX_CACHE_MAX_ENTRIES = 10_000
+_MX_CACHE_MAX_TTL = 3600
+_MX_CACHE_NEGATIVE_TTL = 300
+_mx_cache = {}
+_mx_cache_lock = threading.Lock()
+# A slow or unreachable name server fails the lookup after this many seconds instead of the
+# resolver default of several retries at 5 seconds each.
+_MX_RESOLVER_TIMEOUT = 1.0
+_MX_RESOLVER_LIFETIME = 2.0
+_mx_resolver = None
+# dnspython's "no such records" exceptions and the base class of its other lookup failures
+# (timeouts, no reachable name servers), bound alongside the resolver
+_mx_missing_errors = ()
+_mx_lookup_error = None
+
+
+def _get_mx_resolver():
+    """Returns the shared resolver, creating it on first use."""
+    global _mx_resolver, _mx_missing_errors, _mx_lookup_error
+    if _mx_resolver is None:
+        # Imported on first use so workers that never validate email skip loading dnspython
+        import dns.exception
+        import dns.resolver
+
+        _mx_missing_errors = (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN)
+        _mx_lookup_error = dns.exception.DNSException
+        resolver = dns.resolver.Resolver()
+        resolver.timeout = _MX_RESOLVER_TIMEOUT
+        resolver.lifetime = _MX_RESOLVER_LIFETIME
+        _mx_resolver = resolver
+    return _mx_resolver
+
+
+def _is_plausible_domain(domain: str) -> bool:
+    """
+    Checks the shape of a domain name without going to DNS: every label is 1-63 characters
+    and does not start or end with a hyphen, and the top-level label is at least two letters
+    or an internationalised (xn--) label.
+    """
+    labels = domain.split(".")
+    for label in labels:
+        if not 0 < len(label) <= 63 or label.startswith("-") or label.endswith("-"):
+            return False
+    tld = labels[-1]
+    return (len(tld) >= 2 and tld.isalpha()) or tld.startswith("xn--")
+
+
+def _cached_domain_has_mx(domain: str) -> Union[bool, None]:
+    """
+    Returns the cached answer for whether the domain has MX records, or None when there
+    is no live cache entry.
+    """
+    cached = _mx_cache.get(domain)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _domain_has_mx(domain: str) -> Union[bool, None]:
+    """
+    Returns whether the domain has MX records, consulting the TTL cache first.
+    Returns None when the lookup failed (timed out or no name server answered); that
+    outcome is not cached.
+    """
+    cached = _cached_domain_has_mx(domain)
+    if cached is not None:
+        return cached
+
+    resolver = _get_mx_resolver()
+    try:
+        answer = resolver.resolve(domain, 'MX')
+    except _mx_missing_errors:
+        has_mx, ttl = False, _MX_CACHE_NEGATIVE_TTL
+    except _mx_lookup_error:
+        return None
+    else:
+        has_mx, ttl = True, min(answer.rrset.ttl, _MX_CACHE_MAX_TTL)
+
+    now = time.monotonic()
+    with _mx_cache_lock:
+        if domain not in _mx_cache and len(_mx_cache) >= _MX_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry; dicts keep insertion order
+            del _mx_cache[next(iter(_mx_cache))]
+        _mx_cache[domain] = (now + ttl, has_mx)
+    return has_mx
+
+
 class EmailValidator(MinMaxLengthValidator):
     """Validates email IDs to ensure correct formatting and valid domain."""
+
+    __slots__ = ()
     
     def __init__(self, min_length: int = 5, max_length: int = 254):
          super().__init__(min_length, max_length)
@@ -191,41 +311,77 @@ class EmailValidator(MinMaxLengthValidator):
         Validate the email ID to ensure it follows standard email formatting and includes a valid domain.
         :param emailid: The email ID to validate.
         """
-        # Sanitize the input to prevent XSS
-        emailid = html.escape(emailid)
-        
+        domain = self.validate_format(emailid)
+        self.validate_domain(domain, _domain_has_mx(domain))
+        return True
+
+    async def validate_async(self, emailid: str):
+        """
+        Same checks as validate, for async handlers: the MX lookup blocks, so it runs in the
+        threadpool, and only when the answer for the domain is not already cached.
+        :param emailid: The email ID to validate.
+        """
+        domain = self.validate_format(emailid)
+        has_mx = _cached_domain_has_mx(domain)
+        if has_mx is None:
+            has_mx = await run_in_threadpool(_domain_has_mx, domain)
+        self.validate_domain(domain, has_mx)
+        return True
+
+    def validate_format(self, emailid: str) -> str:
+        """
+        Validate the email ID's length and format without any DNS lookup. Returns the domain.
+        :param emailid: The email ID to validate.
+        """
         # Reuse MinMaxLengthValidator's checks for email length
         super().validate(emailid)
 
         if not emailid:
             self.raise_validation_error("Email ID cannot be empty.")
 
-        # Split the email to get the username and domain
-        username, domain = emailid.split('@', 1)
+        # Split the email to get the username and domain; without an '@' it cannot be an email ID
+        username, at, domain = emailid.partition('@')
+        if not at:
+            self.raise_validation_error("Invalid email ID format.")
 
         # Check if the username is at least 3 characters long
         if len(username) < 3:
             self.raise_validation_error("Username must be at least 3 characters long.")
 
         # Check if the email contains uppercase letters
-        if any(char.isupper() for char in emailid):
+        if emailid != emailid.lower():
             self.raise_validation_error("Email ID must not contain uppercase letters.")
 
-        # Validate email format using regex
-        if not re.match(r"^[a-z0-9_.+-]+@[a-z0-9-]+\.[a-z0-9-.]+$", emailid, re.IGNORECASE):
+        # Validate email format using regex; uppercase was rejected above, so no case folding is needed
+        if not _email_fullmatch(emailid):
             self.raise_validation_error("Invalid email ID format.")
 
-        # Validate if the domain has DNS records (basic check for MX records)
-        try:
-            dns.resolver.resolve(domain, 'MX')
-        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
-            self.raise_validation_error(f"Invalid domain in email: {domain} does not have MX records.")
+        # Typos such as a numeric or one-letter TLD can be rejected without a DNS round trip
+        if not _is_plausible_domain(domain):
+            self.raise_validation_error(f"Invalid domain in email: {domain} is not a valid domain name.")
 
-        return True
+        return domain
+
+    def validate_domain(self, domain: str, has_mx: Union[bool, None]):
+        """
+        Validate the outcome of the MX lookup for the email's domain.
+        :param domain: The domain of the email ID.
+        :param has_mx: Whether the domain has MX records, or None if the lookup failed.
+        """
+        if has_mx is None:
+            # The input may well be valid; the failure is on our side, so it is not a 422
+            raise HTTPException(
+                status_code=503,  # HTTP status code for Service Unavailable
+                detail={"error": f"Could not verify the domain in email: DNS lookup for {domain} failed."},
+            )
+        if not has_mx:
+            self.raise_validation_error(f"Invalid domain in email: {domain} does not have MX records.")
     
 class ZipcodeValidator(MinMaxLengthValidator):
     """Validates U.S. zip codes and ZIP+4 format."""
 
+    __slots__ = ()
+
     def __init__(self, min_length: int = 5, max_length: int = 10):
         super().__init__(min_length, max_length)
 
@@ -237,16 +393,18 @@ class ZipcodeValidator(MinMaxLengthValidator):
         if not zipcode:
             self.raise_validation_error("Zip code cannot be empty.")
         
-        # Sanitize the input to prevent XSS
-        zipcode = html.escape(zipcode)
-        
-        # Check length using the MinMaxLengthValidator
-        super().validate(zipcode)
-
-        # Regex for U.S. zip code (5 digits or ZIP+4 format)
-        regex = r"^\d{5}(-\d{4})?$"
+        # Check length against min_length and max_length, with the parent class's messages
+        length = len(zipcode)
+        if self.min_length is not None and length < self.min_length:
+            self.raise_validation_error(f"String must be at least {self.min_length} characters long.")
+        if self.max_length is not None and length > self.max_length:
+            self.raise_validation_error(f"String must be at most {self.max_length} characters long.")
 
-        if not re.fullmatch(regex, zipcode):
+        # U.S. zip code: 5 digits or ZIP+4 format
+        zip5, dash, plus4 = zipcode.partition("-")
+        if not (
+            len(zip5) == 5 and zip5.isdecimal() and (not dash or (len(plus4) == 4 and plus4.isdecimal()))
+        ):
             self.raise_validation_error("Invalid zip code format. Must be 5 digits or ZIP+4 format.")
         
         return "Valid zip code."
@@ -255,6 +413,8 @@ class ZipcodeValidator(MinMaxLengthValidator):
 class PincodeValidator(MinMaxLengthValidator):
     """Validates Indian pincodes."""
 
+    __slots__ = ()
+
     def __init__(self, min_length: int = 6, max_length: int = 6):
         super().__init__(min_length, max_length)
 
@@ -266,16 +426,15 @@ class PincodeValidator(MinMaxLengthValidator):
         if not pincode:
             self.raise_validation_error("Pincode cannot be empty.")
             
-        # Sanitize the input to prevent XSS
-        pincode = html.escape(pincode)
-        
-        # Check length using the MinMaxLengthValidator
-        super().validate(pincode)
-
-        # Regex for Indian pincode (6 digits)
-        regex = r"^\d{6}$"
+        # Check length against min_length and max_length, with the parent class's messages
+        length = len(pincode)
+        if self.min_length is not None and length < self.min_length:
+            self.raise_validation_error(f"String must be at least {self.min_length} characters long.")
+        if self.max_length is not None and length > self.max_length:
+            self.raise_validation_error(f"String must be at most {self.max_length} characters long.")
 
-        if not re.fullmatch(regex, pincode):
+        # Indian pincode: 6 digits (length is already enforced above)
+        if not pincode.isdecimal():
             self.raise_validation_error("Invalid pincode format. Must be exactly 6 digits.")
         
         return "Valid pincode."
@@ -286,6 +445,8 @@ class FileValidator(BaseValidator):
     Includes validation for file name, type, and size.
     """
 
+    __slots__ = ("allowed_extensions", "max_file_size_mb", "_allowed_types", "_max_file_size_bytes", "_size_error")
+
     def __init__(self, allowed_extensions: List[str], max_file_size_mb: int):
         """
         Initialize the validator with allowed extensions and maximum file size.
@@ -293,8 +454,12 @@ class FileValidator(BaseValidator):
         :param allowed_extensions: List of allowed file extensions (e.g., ['.jpg', '.png']).
         :param max_file_size_mb: Maximum allowed file size in MB.
         """
-        self.allowed_extensions = [ext.lower() for ext in allowed_extensions]
+        self.allowed_extensions = frozenset(ext.lower() for ext in allowed_extensions)
+        # Rendered once for the unsupported-type message
+        self._allowed_types = str(sorted(self.allowed_extensions))
         self.max_file_size_mb = max_file_size_mb
+        self._max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self._size_error = f"File size exceeds {max_file_size_mb} MB limit."
 
     def validate(self, file: UploadFile):
         """
@@ -308,7 +473,13 @@ class FileValidator(BaseValidator):
         """
         Validate the file name to ensure it does not contain spaces or special characters.
         """
-        if not re.match(r'^[\w_]+\.[a-zA-Z0-9]+$', file_name):
+        # A word-character stem ("_" or str.isalnum, as \w in re) and an ASCII alphanumeric extension
+        stem, dot, extension = file_name.rpartition(".")
+        if not (
+            stem.replace("_", "0").isalnum()
+            and extension.isascii()
+            and extension.isalnum()
+        ):
             self.raise_validation_error(
                 "File name should not contain spaces or special characters other than underscores."
             )
@@ -317,39 +488,89 @@ class FileValidator(BaseValidator):
         """
         Validate the file extension to ensure it matches the allowed extensions.
         """
-        file_extension = os.path.splitext(file_name)[1].lower()
+        # validate_file_name has already ensured there is exactly one dot, after the stem
+        dot_index = file_name.rfind(".")
+        file_extension = file_name[dot_index:].lower() if dot_index > 0 else ""
         if file_extension not in self.allowed_extensions:
             self.raise_validation_error(
-                f"Unsupported file type: {file_extension}. Allowed types: {self.allowed_extensions}"
+                f"Unsupported file type: {file_extension}. Allowed types: {self._allowed_types}"
             )
 
     def validate_file_size(self, file: UploadFile):
         """
         Validate the file size to ensure it is within the allowed limit.
-        """
-        file_size = len(file.file.read())  # Read the file to get its size
-        if file_size > self.max_file_size_mb * 1024 * 1024:
-            self.raise_validation_error(
-                f"File size exceeds {self.max_file_size_mb} MB limit."
-            )
-        file.file.seek(0)  # Reset the file pointer after reading
+        The size Starlette recorded while receiving the upload is used when available. Otherwise
+        seekable uploads are measured by seeking to the end, and others are read in chunks with
+        reading stopping as soon as the limit is exceeded.
+        """
+        max_file_size = self._max_file_size_bytes
+        stream = file.file
+        if file.size is not None:
+            file_size = file.size
+        elif stream.seekable():
+            file_size = stream.seek(0, os.SEEK_END)
+            stream.seek(0)  # Reset the file pointer after measuring
+        else:
+            # A single buffer is filled in place for every chunk instead of allocating new bytes
+            buffer = bytearray(min(_UPLOAD_CHUNK_SIZE, max_file_size + 1))
+            file_size = 0
+            while file_size <= max_file_size:
+                read = stream.readinto(buffer)
+                if not read:
+                    break
+                file_size += read
+        if file_size > max_file_size:
+            self.raise_validation_error(self._size_error)
 
 class DocumentValidator(FileValidator):
     """Validator for Document files."""
+
+    __slots__ = ()
+
     def __init__(self, max_file_size_mb: int = 2):
         super().__init__(allowed_extensions=[".pdf",".docx","xlsx"], max_file_size_mb=max_file_size_mb)
 
 
 class ImageValidator(FileValidator):
     """Validator for image files."""
+
+    __slots__ = ()
+
     def __init__(self, max_file_size_mb: int = 5):
         super().__init__(allowed_extensions=[".jpg", ".jpeg", ".png", ".gif"], max_file_size_mb=max_file_size_mb)
-import re
 
-from fastapi import HTTPException, APIRouter, UploadFile
-from datetime import datetime
+
+_digit_search = re.compile(r"\d").search
+_lowercase_search = re.compile(r"[a-z]").search
+_uppercase_search = re.compile(r"[A-Z]").search
+_special_character_search = re.compile(r"[!@#$%^&*(),.?\":{}|<>]").search
+_SPECIAL_CHARACTERS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Time tails of the fixed-width formats, keyed by (length, character at offset 6).
+_FIXED_WIDTH_TIME_FORMATS = {
+    (0, None): "",
+    (6, None): " %H:%M",
+    (9, ":"): " %H:%M:%S",
+    (9, " "): " %I:%M %p",
+    (12, ":"): " %I:%M:%S %p",
+}
 
 
+def _separator_fingerprint(text: str) -> tuple:
+    """Which of the date and time separators '-', '/' and ':' appear in the text."""
+    return ("-" in text, "/" in text, ":" in text)
+
+
+def _index_formats_by_separators(formats) -> dict:
+    """
+    Groups strptime formats by the separators they contain, keeping their relative order.
+    No directive used by the supported formats can match one of these separators, so an
+    input can only match the formats whose fingerprint equals its own.
+    """
+    index = {}
+    for fmt in formats:
+        index.setdefault(_separator_fingerprint(fmt), []).append(fmt)
+    return {fingerprint: tuple(fmts) for fingerprint, fmts in index.items()}
 
 
 class DateValidator:
@@ -361,40 +582,102 @@ class DateValidator:
     - With optional time in HH:mm or HH:mm:ss or HH:mm:ss AM/PM
     """
 
+    __slots__ = ("date_string",)
+
+    # Supported date and time formats
+    supported_formats = (
+        "%Y-%m-%d",                  # Date only
+        "%Y-%m-%d %H:%M",           # Date and time (24-hour)
+        "%Y-%m-%d %H:%M:%S",        # Date and time with seconds
+        "%d/%m/%Y",                 # Date only
+        "%d/%m/%Y %H:%M",           # Date and time (24-hour)
+        "%d/%m/%Y %H:%M:%S",        # Date and time with seconds
+        "%m/%d/%Y",                 # Date only
+        "%m/%d/%Y %H:%M",           # Date and time (24-hour)
+        "%m/%d/%Y %H:%M:%S",        # Date and time with seconds
+        "%Y-%m-%d %I:%M %p",        # Date and time (12-hour with AM/PM)
+        "%Y-%m-%d %I:%M:%S %p",     # Date and time with seconds and AM/PM
+        "%d/%m/%Y %I:%M %p",        # Date and time (12-hour with AM/PM)
+        "%d/%m/%Y %I:%M:%S %p",     # Date and time with seconds and AM/PM
+        "%m/%d/%Y %I:%M %p",        # Date and time (12-hour with AM/PM)
+        "%m/%d/%Y %I:%M:%S %p",     # Date and time with seconds and AM/PM
+        "%d %b %Y",                 # Date with abbreviated month name (e.g., 23 May 2020)
+        "%d %B %Y",                 # Date with full month name (e.g., 23 May 2020)
+        "%d %B %Y %H:%M",           # Date and time with full month name
+        "%d %B %Y %H:%M:%S",        # Date and time with seconds and full month name
+    )
+    _formats_by_separators = _index_formats_by_separators(supported_formats)
+
     def __init__(self, date_string: str):
         self.date_string = date_string
-        # Supported date and time formats
-        self.supported_formats = [
-            "%Y-%m-%d",                  # Date only
-            "%Y-%m-%d %H:%M",           # Date and time (24-hour)
-            "%Y-%m-%d %H:%M:%S",        # Date and time with seconds
-            "%d/%m/%Y",                 # Date only
-            "%d/%m/%Y %H:%M",           # Date and time (24-hour)
-            "%d/%m/%Y %H:%M:%S",        # Date and time with seconds
-            "%m/%d/%Y",                 # Date only
-            "%m/%d/%Y %H:%M",           # Date and time (24-hour)
-            "%m/%d/%Y %H:%M:%S",        # Date and time with seconds
-            "%Y-%m-%d %I:%M %p",        # Date and time (12-hour with AM/PM)
-            "%Y-%m-%d %I:%M:%S %p",     # Date and time with seconds and AM/PM
-            "%d/%m/%Y %I:%M %p",        # Date and time (12-hour with AM/PM)
-            "%d/%m/%Y %I:%M:%S %p",     # Date and time with seconds and AM/PM
-            "%m/%d/%Y %I:%M %p",        # Date and time (12-hour with AM/PM)
-            "%m/%d/%Y %I:%M:%S %p",     # Date and time with seconds and AM/PM
-            "%d %b %Y",                 # Date with abbreviated month name (e.g., 23 May 2020)
-            "%d %B %Y",                 # Date with full month name (e.g., 23 May 2020)
-            "%d %B %Y %H:%M",           # Date and time with full month name
-            "%d %B %Y %H:%M:%S",        # Date and time with seconds and full month name
-        ]
-
-    def determine_format(self) -> str:
-        """
-        Determines the likely format of the date string by attempting to parse it.
-        """
-        for fmt in self.supported_formats:
+
+    def parse_fixed_width_format(self):
+        """
+        Parses the two-digit-field forms of the supported formats (YYYY-MM-DD, DD/MM/YYYY and
+        MM/DD/YYYY, optionally followed by HH:mm, HH:mm:ss or either with AM/PM) by slicing the
+        fields at fixed offsets, without going through strptime.
+        Day-first is tried before month-first, in the same order as supported_formats.
+        Returns (format, datetime), or None when the input is not in one of these shapes or
+        does not name a real date and time, so the strptime formats get the final say.
+        """
+        date_string = self.date_string
+        time_part = date_string[10:]
+        time_format = _FIXED_WIDTH_TIME_FORMATS.get(
+            (len(time_part), time_part[6] if len(time_part) > 6 else None)
+        )
+        if time_format is None or not date_string.isascii():
+            return None
+
+        if time_format:
+            hour, minute = time_part[1:3], time_part[4:6]
+            second = time_part[7:9] if "%S" in time_format else "00"
+            meridiem = time_part[-2:].upper() if time_format.endswith("%p") else None
+            if (
+                time_part[0] != " "
+                or time_part[3] != ":"
+                or (meridiem is not None and time_part[-3] != " ")
+                or not (hour.isdigit() and minute.isdigit() and second.isdigit())
+            ):
+                return None
+            hour = int(hour)
+            if meridiem is not None:
+                if meridiem not in ("AM", "PM") or not 1 <= hour <= 12:
+                    return None
+                hour = hour % 12 + (12 if meridiem == "PM" else 0)
+            time_fields = (hour, int(minute), int(second))
+        else:
+            time_fields = (0, 0, 0)
+
+        if date_string[4:5] == "-" and date_string[7:8] == "-":
+            year, month, day = date_string[:4], date_string[5:7], date_string[8:10]
+            candidates = (("%Y-%m-%d", month, day),)
+        elif date_string[2:3] == "/" and date_string[5:6] == "/":
+            first, second_field, year = date_string[:2], date_string[3:5], date_string[6:10]
+            candidates = (("%d/%m/%Y", second_field, first), ("%m/%d/%Y", first, second_field))
+        else:
+            return None
+        if len(year) != 4 or not year.isdigit():
+            return None
+
+        for date_format, month, day in candidates:
+            if not (month.isdigit() and day.isdigit()):
+                return None
+            try:
+                return date_format + time_format, datetime(int(year), int(month), int(day), *time_fields)
+            except ValueError:
+                continue
+        return None
+
+    def determine_format(self) -> tuple:
+        """
+        Determines the format of the date string by attempting to parse it.
+        Returns (format, datetime) for the first supported format that parses.
+        """
+        # Only the formats with the same separators as the input can match it
+        for fmt in self._formats_by_separators.get(_separator_fingerprint(self.date_string), ()):
             try:
                 # Try parsing with the current format
-                datetime.strptime(self.date_string, fmt)
-                return fmt
+                return fmt, datetime.strptime(self.date_string, fmt)
             except ValueError:
                 continue
 
@@ -403,17 +686,15 @@ class DateValidator:
             detail="Unable to determine the format of the date."
         )
 
-    def validate_calendar_date(self, date_format: str) -> datetime:
+    def _parse(self):
         """
-        Ensures the date and time exist in the calendar. Returns the parsed date if valid.
+        Parses the date string, using the fixed-width parser when it applies and the
+        strptime formats otherwise. Returns (format, datetime).
         """
-        try:
-            return datetime.strptime(self.date_string, date_format)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid date or time. Ensure the input matches the format {date_format}."
-            )
+        parsed = self.parse_fixed_width_format()
+        if parsed is not None:
+            return parsed
+        return self.determine_format()
 
     def validate_not_future_year(self, date_obj: datetime) -> None:
         """
@@ -426,32 +707,13 @@ class DateValidator:
                 detail="Invalid year. Year cannot be in the future."
             )
 
-    def validate_month(self, date_obj: datetime) -> None:
-        """
-        Ensures the input contains a valid month name or number.
-        """
-        try:
-            # Extract the month from the datetime object and validate
-            if date_obj.month < 1 or date_obj.month > 12:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid month. Please provide a valid month number (01-12) or name."
-                )
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid month format. Ensure the input contains a valid month."
-            )
-
     def validate(self) -> None:
         """
         Perform all validations on the date and time.
         """
-        date_format = self.determine_format()
-        date_obj = self.validate_calendar_date(date_format)
+        date_format, date_obj = self._parse()
         self.validate_not_future_year(date_obj)
-        self.validate_month(date_obj)
-        print(f"Date and time '{self.date_string}' are valid and follow the format {date_format}.")
+        logger.debug("Date and time '%s' are valid and follow the format %s.", self.date_string, date_format)
  
  
 
@@ -462,6 +724,8 @@ class BooleanValidator:
     A class to validate boolean inputs.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -469,7 +733,8 @@ class BooleanValidator:
         """
         Validates that the input is a boolean value (True or False).
         """
-        if not isinstance(self.value, bool):
+        # bool cannot be subclassed, so an identity check covers every boolean
+        if self.value is not True and self.value is not False:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid input. Value must be a boolean (True or False)."
@@ -480,6 +745,8 @@ class PasswordValidator:
     A class to validate the strength of passwords.
     """
 
+    __slots__ = ("password",)
+
     def __init__(self, password: str):
         self.password = password
 
@@ -497,7 +764,7 @@ class PasswordValidator:
         """
         Validates that the password includes at least one number.
         """
-        if not re.search(r"\d", self.password):
+        if not _digit_search(self.password):
             raise HTTPException(
                 status_code=400,
                 detail="Password must include at least one number."
@@ -507,7 +774,7 @@ class PasswordValidator:
         """
         Validates that the password includes at least one lowercase letter.
         """
-        if not re.search(r"[a-z]", self.password):
+        if not _lowercase_search(self.password):
             raise HTTPException(
                 status_code=400,
                 detail="Password must include at least one lowercase letter."
@@ -517,7 +784,7 @@ class PasswordValidator:
         """
         Validates that the password includes at least one uppercase letter.
         """
-        if not re.search(r"[A-Z]", self.password):
+        if not _uppercase_search(self.password):
             raise HTTPException(
                 status_code=400,
                 detail="Password must include at least one uppercase letter."
@@ -527,7 +794,7 @@ class PasswordValidator:
         """
         Validates that the password includes at least one special character.
         """
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", self.password):
+        if not _special_character_search(self.password):
             raise HTTPException(
                 status_code=400,
                 detail="Password must include at least one special character."
@@ -536,12 +803,34 @@ class PasswordValidator:
     def validate(self) -> str:
         """
         Perform all validations for the password.
+        The character classes are collected in one pass over the password and
+        reported in the same order as the individual validate_* checks.
         """
         self.validate_length()
-        self.validate_numeric()
-        self.validate_lowercase()
-        self.validate_uppercase()
-        self.validate_special_character()
+
+        has_number = has_lowercase = has_uppercase = has_special_character = False
+        for char in self.password:
+            if "a" <= char <= "z":
+                has_lowercase = True
+            elif "A" <= char <= "Z":
+                has_uppercase = True
+            elif char.isdecimal():  # Same characters as \d
+                has_number = True
+            elif char in _SPECIAL_CHARACTERS:
+                has_special_character = True
+            else:
+                continue
+            if has_number and has_lowercase and has_uppercase and has_special_character:
+                break
+
+        if not has_number:
+            raise HTTPException(status_code=400, detail="Password must include at least one number.")
+        if not has_lowercase:
+            raise HTTPException(status_code=400, detail="Password must include at least one lowercase letter.")
+        if not has_uppercase:
+            raise HTTPException(status_code=400, detail="Password must include at least one uppercase letter.")
+        if not has_special_character:
+            raise HTTPException(status_code=400, detail="Password must include at least one special character.")
         return self.password
     
 # Cross-site validation
@@ -550,6 +839,8 @@ class CrossFieldDateValidator(DateValidator):
     A subclass of DateValidator that validates the relationship between two dates.
     """
 
+    __slots__ = ("start_date_string", "end_date_string")
+
     def __init__(self, start_date: str, end_date: str):
         super().__init__(start_date)  # Initialize with the start_date
         self.start_date_string = start_date
@@ -559,14 +850,12 @@ class CrossFieldDateValidator(DateValidator):
         """
         Validate both dates individually and ensure the start date is before the end date.
         """
-        # Validate both dates using the parent class methods
-        self.date_string = self.start_date_string  # Set the current date to start_date
-        self.validate_date_format()
-        start_date_obj = self.validate_calendar_date()
+        # Parse each date once with its own DateValidator, leaving self.date_string untouched
+        _, start_date_obj = DateValidator(self.start_date_string)._parse()
+        self.validate_not_future_year(start_date_obj)
 
-        self.date_string = self.end_date_string  # Set the current date to end_date
-        self.validate_date_format()
-        end_date_obj = self.validate_calendar_date()
+        _, end_date_obj = DateValidator(self.end_date_string)._parse()
+        self.validate_not_future_year(end_date_obj)
 
         # Validate the relationship between start_date and end_date
         self.validate_start_before_end(start_date_obj, end_date_obj)
@@ -582,369 +871,40 @@ class CrossFieldDateValidator(DateValidator):
             )
 
 
+# Validators hold no per-request state, so the default configurations are built once at
+# import time and shared; import these instead of constructing a validator per request.
+numeric_validator = NumericValidator()
+alphanumeric_validator = AlphanumericValidator()
+alphabetset_validator = AlphabetSetValidator()
+phone_number_validator = PhoneNumberValidator()
+email_validator = EmailValidator()
+zipcode_validator = ZipcodeValidator()
+pincode_validator = PincodeValidator()
+
+
+# Parameterised validators are built once per combination of arguments and then reused.
+@lru_cache(maxsize=128)
+def get_range_validator(min_value: float, max_value: float) -> RangeValidator:
+    return RangeValidator(min_value=min_value, max_value=max_value)
+
+
+@lru_cache(maxsize=128)
+def get_age_validator(max_age: int = None) -> AgeValidator:
+    return AgeValidator(max_age=max_age)
+
+
+@lru_cache(maxsize=128)
+def get_decimal_validator(max_decimal_places: int = None) -> DecimalValidator:
+    return DecimalValidator(max_decimal_places=max_decimal_places)
 
-# from PIL import Image  # To check dimensions
-# import os
-# import dns.resolver
-
-# def validate_pincode(pincode: str) -> None:
-#     """
-#     Validates a pincode to ensure it meets the required criteria:
-#     - Must be exactly 6 digits
-#     - Must be numeric
-
-#     Args:
-#         pincode (str): The pincode to validate
-
-#     Raises:
-#         HTTPException: If validation fails
-#     """
-#     if not re.match(r"^\d{6}$", pincode):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Invalid pincode: It must be exactly 6 numeric digits."
-#         )
-
-
-# # validation for address
-# def validate_address(address: str) -> None:
-#     """
-#     Validates an address to ensure it meets the required criteria:
-#     - Must be at least 5 characters long
-#     - Must not exceed 100 characters
-#     - Must not contain special characters other than space, comma, or hyphen
-
-#     Args:
-#         address (str): The address to validate
-
-#     Raises:
-#         HTTPException: If validation fails
-#     """
-#     if len(address) < 5 or len(address) > 100:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Invalid address: It must be between 5 and 100 characters."
-#         )
-#     if not re.match(r"^[a-zA-Z0-9\s,.-]+$", address):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Invalid address: Only letters, numbers, spaces, commas, periods, and hyphens are allowed."
-#         )
-
-
-# VALID_GENDERS = {"male", "female", "other"}  # Use lowercase values for consistent validation
-
-# def validate_gender(gender: str) -> str:
-#     """
-#     Validates the gender field to ensure it matches one of the predefined options
-#     and has a minimum length of 4 characters. Converts uppercase input to lowercase.
-
-#     Args:
-#         gender (str): The gender value to validate.
-
-#     Returns:
-#         str: The validated and normalized gender value in lowercase.
-
-#     Raises:
-#         HTTPException: If the gender value is invalid.
-#     """
-#     # Convert to lowercase
-#     gender = gender.lower()
-
-#     # Check minimum length
-#     if len(gender) < 4:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Invalid gender: The value must be at least 4 characters long."
-#         )
-
-#     # Validate against allowed options
-#     if gender not in VALID_GENDERS:
-#         raise HTTPException(
-#             status_code=400,
-#             detail=f"Invalid gender: Allowed values are {', '.join(VALID_GENDERS)}."
-#         )
-
-#     return gender
-
-
-
-# # validation for firstname,middlename and lastname 
-# def validate_name(name: str, field_name: str) -> None:
-#     """
-#     Validates a name field (firstname, lastname, middlename).
-    
-#     Args:
-#         name (str): The name value to validate.
-#         field_name (str): The name of the field (e.g., firstname, lastname).
-
-#     Raises:
-#         HTTPException: If the name value is invalid.
-#     """
-#     if len(name) < 3:
-#         raise HTTPException(
-#             status_code=400,
-#             detail=f"Invalid {field_name}: It must be at least 2 characters long."
-#         )
-
-#     if len(name) > 50:
-#         raise HTTPException(
-#             status_code=400,
-#             detail=f"Invalid {field_name}: It must not exceed 50 characters."
-#         )
-
-#     if not re.match(r"^[a-zA-Z\s'-]+$", name):
-#         raise HTTPException(
-#             status_code=400,
-#             detail=f"Invalid {field_name}: Only alphabetic characters, spaces, hyphens, and apostrophes are allowed."
-#         )
-
-
-
-# # validation for password
-# def validate_password(password: str) -> str:
-#     """
-#     Validates the password to ensure it meets the specified criteria.
-
-#     Args:
-#         password (str): The password to validate.
-
-#     Returns:
-#         str: The validated password.
-
-#     Raises:
-#         HTTPException: If any validation fails.
-#     """
-#     # 1. Check minimum length
-#     if len(password) < 8:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Password must be at least 8 characters long."
-#         )
-
-#     # 2. Check if the password includes at least one number
-#     if not re.search(r"\d", password):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Password must include at least one number."
-#         )
-
-#     # 3. Check if the password includes at least one lowercase letter
-#     if not re.search(r"[a-z]", password):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Password must include at least one lowercase letter."
-#         )
-
-#     # 4. Check if the password includes at least one uppercase letter
-#     if not re.search(r"[A-Z]", password):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Password must include at least one uppercase letter."
-#         )
-
-#     # 5. Check if the password includes at least one special character
-#     if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Password must include at least one special character."
-#         )
-
-#     return password
-
-
-
-
-# def validate_placename(placename: str):
-#     """
-#     Validate place name to ensure it contains only alphabets, 
-#     meets length requirements, and is not empty.
-#     """
-#     if not placename:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Place name cannot be empty."
-#         )
-    
-#     if not re.match(r"^[a-zA-Z\s]+$", placename):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="District name must contain only alphabets and spaces."
-#         )
-    
-#     if len(placename) < 3:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="District name must be at least 3 characters long."
-#         )
-    
-#     if len(placename) > 50:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Place name cannot exceed 50 characters."
-#         )
-
-
-
-# def validate_emailid(emailid: str):
-#     """
-#     Validate email ID to ensure it follows standard email formatting and includes a valid domain.
-#     """
-#     if not emailid:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Email ID cannot be empty."
-#         )
-        
-#     # Check if the email length is within the valid range
-#     if len(emailid) > 254:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Email ID exceeds the maximum allowed length of 254 characters."
-#         )
-
-#     # Validate email format
-#     if not re.match(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$", emailid):
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Invalid email ID format."
-#         )
-
-#     # Extract domain from the email
-#     domain = emailid.split('@')[-1]
-
-#     # Validate if the domain has DNS records (basic check for MX records)
-#     try:
-#         dns.resolver.resolve(domain, 'MX')
-#     except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
-#         raise HTTPException(
-#             status_code=400,
-#             detail=f"Invalid domain in email: {domain} does not have MX records."
-#         )
-    
-#     return True
-        
-# #install and import phonenumbers library version phonenumbers=8.13.52
-# def validate_phonenumber(phonenumber: str):
-#     """
-#     Validate phone number to ensure it follows international standards and is valid.
-#     """
-#     if not phonenumber:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Phone number cannot be empty."
-#         )
-
-#     try:
-#         # Parse the phone number using the phonenumbers library
-#         parsed_number = phonenumbers.parse(phonenumber, None)  # None allows parsing without a default region
-        
-#         # Check if the phone number is valid
-#         if not phonenumbers.is_valid_number(parsed_number):
-#             raise HTTPException(
-#                 status_code=400,
-#                 detail="Invalid phone number."
-#             )
-        
-#         # Optional: Check if it's a mobile number
-#         if not phonenumbers.number_type(parsed_number) == phonenumbers.PhoneNumberType.MOBILE:
-#             raise HTTPException(
-#                 status_code=400,
-#                 detail="The provided phone number is not a mobile number."
-#             )
-#     except phonenumbers.NumberParseException as e:
-#         raise HTTPException(
-#             status_code=400,
-#             detail=f"Invalid phone number format: {str(e)}"
-#         )
-        
-# def validate_image(image: UploadFile):
-#     """
-#     Validate the uploaded image.
-#     - Ensure it's an image file.
-#     - Restrict file types to JPEG, PNG, etc.
-#     - Check file size.
-#     - Optionally validate image dimensions.
-#     - Check if the image is corrupted.
-#     """
-    
-#     # 1. Validate file name (no spaces or special characters other than underscores)
-#     file_name = image.filename
-#     if not re.match(r'^[\w_]+\.[a-zA-Z0-9]+$', file_name):  # Allow only letters, numbers, and underscores
-#         raise HTTPException(
-#             status_code=400,
-#             detail="File name should not contain spaces or special characters other than underscores."
-#         )
-        
-#     # 2. Validate file extension
-#     valid_extensions = [".jpg", ".jpeg", ".png",".gif"]
-#     file_extension = os.path.splitext(image.filename)[1].lower()
-
-#     if file_extension not in valid_extensions:
-#         raise HTTPException(
-#             status_code=400, detail=f"Unsupported file type: {file_extension}. Allowed types: {valid_extensions}"
-#         )
-
-#     # 3. Validate file size
-#     file_size = len(image.file.read())
-#     max_size_in_mb = 1  # Set the max size (e.g., 1 MB)
-#     if file_size > max_size_in_mb * 1024 * 1024:
-#         raise HTTPException(
-#             status_code=400, detail=f"File size exceeds {max_size_in_mb} MB limit."
-#         )
-
-#     # Reset the file pointer after reading
-#     image.file.seek(0)
-
-#     # 4. Validate image dimensions (optional)
-#     try:
-#         img = Image.open(image.file)
-#         img.verify()  # Verifies that the image is not corrupted
-        
-#         # Reset the file pointer for further processing
-#         image.file.seek(0)
-#         img = Image.open(image.file)  # Open again for actual processing
-#         width, height = img.size
-        
-#         # Define minimum and maximum allowed dimensions
-#         min_width, min_height = 300, 300  # Example minimum dimensions
-#         max_width, max_height = 1920, 1080  # Example maximum dimension
-       
-#        # Validate maximum dimensions
-#         if width < min_width or height < min_height:
-#             raise HTTPException(
-#                 status_code=400,
-#                 detail=f"Image dimensions must be at least {min_width}x{min_height}px. "
-#                        f"Uploaded image is {width}x{height}px."
-#             )
-#         if width > max_width or height > max_height:
-#             raise HTTPException(
-#                 status_code=400,
-#                 detail=f"Image dimensions exceed {max_width}x{max_height}px limit. Uploaded image is {width}x{height}px.",
-#             )
-            
-#        # Validate minimum dimensions
-#         if width < min_width or height < min_height:
-#             raise HTTPException(
-#                 status_code=400,
-#                 detail=f"Image dimensions must be at least {min_width}x{min_height}px. "
-#                        f"Uploaded image is {width}x{height}px."
-#             )
-#         if width < min_width or height < min_height:
-#             raise HTTPException(
-#                 status_code=400,
-#                 detail=f"Image dimensions must be at least {min_width}x{min_height}px. "
-#                        f"Uploaded image is {width}x{height}px."
-#             )
-            
-#     except Exception:
-#         raise HTTPException(
-#             status_code=400, detail="Invalid image file."
-#         )
-#     finally:
-#         # Reset the file pointer again after processing with PIL
-#         image.file.seek(0)
 
-#     return True
+@lru_cache(maxsize=128)
+def get_length_validator(min_length: int, max_length: int) -> MinMaxLengthValidator:
+    return MinMaxLengthValidator(min_length=min_length, max_length=max_length)
 
 
+@lru_cache(maxsize=128)
+def get_phone_number_validator(region: str = None) -> PhoneNumberValidator:
+    if region is None:
+        return phone_number_validator
+    return PhoneNumberValidator(region=region)